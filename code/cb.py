@@ -11,7 +11,9 @@ center_cs_obs
 center_ts_obs
 concat_pdf
 concat_ps
+concat_ps_parallel
 data2fixed
+find_ghostscript
 fixed2data
 form_partition
 format_month_irregular
@@ -35,14 +37,20 @@ Exhibit
 #pandas > 2.2.3
 #PyPDF2 > 3.0.1
 
-import matplotlib, matplotlib.pyplot as plt, matplotlib.font_manager as fman, matplotlib.dates as mdates, matplotlib.ticker as ticker
+import matplotlib, matplotlib.pyplot as plt, matplotlib.font_manager as fman, matplotlib.dates as mdates, matplotlib.ticker as ticker, matplotlib.collections as mcollections
 import sys
+import os
 import numbers
+import numpy as np
 import pandas as pd
 from datetime import timedelta
 import copy
+import functools
+import io
 import re
 import shutil
+import subprocess
+import tempfile
 import PyPDF2 as Pdf
 
 def data2fixed(coord, ax, axis = 0):
@@ -154,35 +162,15 @@ def calc_ts_bar_width(freq, number_stacks = 1, width_coef = 1):
     return(width_coef * freq_dict[freq]/number_stacks)
 
 
-def center_ts_obs(ser, ser_freq = None, number_stacks = 1, curr_stack = 1, width_coef = 1, pos_adj = 0):
-    '''Centers time series observations inside of the time period each observation takes place in. 
-    For instance, a 2017 annual value would be shifted to 2017-07-01 under default behavior. 
-    The adjustment is altered in the case of barcharts with multiple stacks in order to fit all stacks in the appropriate time period.
-    
-    Inputs:
-    ser: pandas.Series whose indexes should be adjusted. The series' frequency is expected to be in ["<Minute>", "<Hour>", "<Day>", "<BusinessDay>", "Week: weekday=6>", "<MonthEnd>", "<QuarterEnd: startingMonth=12>", "<2 * QuarterEnds: startingMonth=12>", "<YearEnd: month=12>"]
-         If not, the Series is returned with no changes.
-    ser_freq: str indicating frequency of ser
-              Should be an element of ["min", "h", "d", "b", "w", "m", "q", "a", "y"] (not case-sensitive), which maps to ["minute", "hour", "daily", "business", "week", "month", "quarter", "annual", "annual"].
-              You may supply "5", "10", "15", "20", or "30" as a prefix to "min" (ie "5min"); "2", "3", "4", "6", "8", or "12" as a prefix to "h"; "6" as a prefix for "m"; or "2" as a prefix to "q" to apply a skip parameter.
-              Defaults to None, in which case this function tries to automatically determine the frequency based on ser's attributes.
-              This argument is only useful when ser does not have a freq attribute (occassionally happens when ser is subsetted down to 1 observation).
-    number_stacks: int indicating how many stacks of bars are to be expected
-                   The default of 1 provides appropriate behavior for line graphs, scatterplots, and barcharts with just 1 stack.
-    curr_stack: int indicating which stack this series belongs in. This should lie between 1 and number_stacks
-                The default of 1 provides appropriate behavior for line graphs, scatterplots, and barcharts with just 1 stack so long as number_stack = 1.
-    width_coef: int or float to be applied as a coefficient to automatically determined width of bars (should match width_coef argument to calc_ts_bar_width)
-                Defaults to 1.
-    pos_adj: int or float specifying adjustment to be made to bars' locations (value is interpreted in units of days). Intended to help correct instances where bar edges overlap
-             Defaults to 0 (assumes no error)
-    
+def _ts_center_shift(ser, ser_freq = None, number_stacks = 1, curr_stack = 1, width_coef = 1, pos_adj = 0):
+    '''Computes the shift center_ts_obs() applies to a time series' dates. Inputs match center_ts_obs().
+
     Output:
-    center_ts_obs(): pandas.Series with same values as ser but with adjusted indexes
+    _ts_center_shift(): timedelta to add to each of ser's dates
     '''
 
-    new_series = copy.deepcopy(ser)
     if ser_freq is None:
-        ser_freq = str(new_series.index.freq)
+        ser_freq = str(ser.index.freq)
     else:
         shorthand_freq_dict = {"min": "<Minute>", "h": "<Hour>", "d": "<Day>", "b": "<BusinessDay>",
                                "w": "Week: weekday=6>", "m": "<MonthEnd>", "6m": "<6 * MonthEnds>", "q": "<QuarterEnd: startingMonth=12>", 
@@ -206,17 +194,88 @@ def center_ts_obs(ser, ser_freq = None, number_stacks = 1, curr_stack = 1, width
     for x in range(0,7):
         freq_dict["<Week: weekday=" + str(x) + ">"] = 7
     
-    freq_check = (ser_freq == "<2 * QuarterEnds: startingMonth=12>" and new_series.index[0].month not in [6,12])
+    freq_check = (ser_freq == "<2 * QuarterEnds: startingMonth=12>" and ser.index[0].month not in [6,12])
     period_length = freq_dict[ser_freq]
     bar_width = width_coef * period_length/number_stacks
     
     if freq_check: #special treatment for when semi-annual series is already centered
-        new_series.index = (new_series.index + timedelta(days = period_length/2)) - timedelta(days = ((.5 - width_coef/2) * period_length) + ((curr_stack - .5) * bar_width) - pos_adj)
-    elif ser_freq in freq_dict.keys():
-        new_series.index = new_series.index - timedelta(days = ((.5 - width_coef/2) * period_length) + ((curr_stack - .5) * bar_width) - pos_adj)
+        return(timedelta(days = period_length/2) - timedelta(days = ((.5 - width_coef/2) * period_length) + ((curr_stack - .5) * bar_width) - pos_adj))
+    return(-timedelta(days = ((.5 - width_coef/2) * period_length) + ((curr_stack - .5) * bar_width) - pos_adj))
+
+
+def center_ts_obs(ser, ser_freq = None, number_stacks = 1, curr_stack = 1, width_coef = 1, pos_adj = 0):
+    '''Centers time series observations inside of the time period each observation takes place in. 
+    For instance, a 2017 annual value would be shifted to 2017-07-01 under default behavior. 
+    The adjustment is altered in the case of barcharts with multiple stacks in order to fit all stacks in the appropriate time period.
+    
+    Inputs:
+    ser: pandas.Series whose indexes should be adjusted. The series' frequency is expected to be in ["<Minute>", "<Hour>", "<Day>", "<BusinessDay>", "Week: weekday=6>", "<MonthEnd>", "<QuarterEnd: startingMonth=12>", "<2 * QuarterEnds: startingMonth=12>", "<YearEnd: month=12>"]
+         If not, the Series is returned with no changes.
+    ser_freq: str indicating frequency of ser
+              Should be an element of ["min", "h", "d", "b", "w", "m", "q", "a", "y"] (not case-sensitive), which maps to ["minute", "hour", "daily", "business", "week", "month", "quarter", "annual", "annual"].
+              You may supply "5", "10", "15", "20", or "30" as a prefix to "min" (ie "5min"); "2", "3", "4", "6", "8", or "12" as a prefix to "h"; "6" as a prefix for "m"; or "2" as a prefix to "q" to apply a skip parameter.
+              Defaults to None, in which case this function tries to automatically determine the frequency based on ser's attributes.
+              This argument is only useful when ser does not have a freq attribute (occassionally happens when ser is subsetted down to 1 observation).
+    number_stacks: int indicating how many stacks of bars are to be expected
+                   The default of 1 provides appropriate behavior for line graphs, scatterplots, and barcharts with just 1 stack.
+    curr_stack: int indicating which stack this series belongs in. This should lie between 1 and number_stacks
+                The default of 1 provides appropriate behavior for line graphs, scatterplots, and barcharts with just 1 stack so long as number_stack = 1.
+    width_coef: int or float to be applied as a coefficient to automatically determined width of bars (should match width_coef argument to calc_ts_bar_width)
+                Defaults to 1.
+    pos_adj: int or float specifying adjustment to be made to bars' locations (value is interpreted in units of days). Intended to help correct instances where bar edges overlap
+             Defaults to 0 (assumes no error)
+    
+    Output:
+    center_ts_obs(): pandas.Series with same values as ser but with adjusted indexes
+    '''
+
+    new_series = copy.deepcopy(ser)
+    new_series.index = new_series.index + _ts_center_shift(ser, ser_freq, number_stacks, curr_stack, width_coef, pos_adj)
     return(new_series)
 
 
+def _center_ts_numeric(ser, x_numeric, x_range, ser_freq = None, number_stacks = 1, curr_stack = 1, width_coef = 1, pos_adj = 0):
+    '''Numeric counterpart to center_ts_obs(impose_ts_xrange(ser, x_range), ...) for callers that already hold ser's dates as matplotlib date numbers.
+    The x-range subset and centering shift are applied to x_numeric directly, so no DatetimeIndex has to be copied and converted on every plot call.
+
+    Inputs:
+    ser: pandas.Series with a PeriodIndex or DatetimeIndex
+    x_numeric: iterable of floats holding ser's dates as matplotlib date numbers (ie matplotlib.dates.date2num(ser.index))
+    x_range: tuple or list of 2 x-coordinates specifying x-axis range (see impose_ts_xrange)
+    Remaining inputs match center_ts_obs().
+
+    Output:
+    _center_ts_numeric(): list holding x-coordinates and values to be plotted
+    '''
+
+    ser = period_to_ts(ser)
+    x_numeric = np.asarray(x_numeric, dtype = float)
+    assert len(x_numeric) == len(ser), "x_numeric must hold one date number per observation in ser."
+    #Same window as impose_ts_xrange(): from the day of x_range[0] through the day after x_range[1]
+    x_bounds = [mdates.date2num(pd.Timestamp(coord)) for coord in x_range] if not isinstance(x_range[0], numbers.Number) else x_range
+    in_range = (x_numeric >= np.floor(x_bounds[0])) & (x_numeric <= np.floor(x_bounds[1]) + 1)
+    shift = _ts_center_shift(ser[in_range], ser_freq, number_stacks, curr_stack, width_coef, pos_adj)/timedelta(days = 1)
+    return([x_numeric[in_range] + shift, ser.values[in_range]])
+
+
+def _stack_bottoms(value_array):
+    '''Computes where each bar of a stacked barchart starts. Positive values stack upward from 0 and negative values stack downward from 0.
+
+    Input:
+    value_array: 2-D array-like of shape (number of series, number of observations) holding the values to be stacked, in plotting order
+
+    Output:
+    _stack_bottoms(): 2-D np.ndarray (same shape as value_array) with the starting position of each bar
+    '''
+
+    value_array = np.asarray(value_array, dtype = float)
+    is_positive = value_array >= 0
+    pos_values = np.where(is_positive, value_array, 0)
+    neg_values = np.where(is_positive, 0, value_array)
+    #Running tallies exclude each series' own values, so subtract them back out of the cumulative sums
+    return(np.where(is_positive, np.cumsum(pos_values, axis = 0) - pos_values, np.cumsum(neg_values, axis = 0) - neg_values))
+
+
 def center_cs_obs(ser, number_stacks = 1, curr_stack = 1, width_coef = .8, pos_adj = 0):
     '''Centers cross-section observations for purposes of graphing.
     Adjustment accounts for how many barstacks appear in the chart.
@@ -251,6 +310,7 @@ def gen_ts_tick_label_range(start, end, freq, skip = ""):
 
     Output:
     gen_ts_tick_label_range(): list of datetime objects
+                               Ranges are cached by (start, end, freq, skip), so repeated calls with the same arguments (ie one per panel) only build the range once.
     '''
     
     freq = freq.upper()
@@ -264,7 +324,38 @@ def gen_ts_tick_label_range(start, end, freq, skip = ""):
     for intraday_freq in ["S", "MIN", "H"]:
         freq_dict[intraday_freq] = intraday_freq.lower()
     
-    return(list(pd.date_range(start, end, freq = f'{str(skip)}{freq_dict[freq]}{"S" * (freq_dict[freq] not in ["S", "MIN", "H", "D", "B", "W"])}')))
+    #A new list is returned on every call so callers can't alter the cached range
+    return(list(_date_range_cached(pd.Timestamp(start), pd.Timestamp(end), f'{str(skip)}{freq_dict[freq]}{"S" * (freq_dict[freq] not in ["S", "MIN", "H", "D", "B", "W"])}')))
+
+
+@functools.lru_cache(maxsize = 256)
+def _date_range_cached(start, end, freq):
+    '''Memoized pd.date_range() backing gen_ts_tick_label_range().
+
+    Inputs:
+    start: pd.Timestamp specifying start of date range
+    end: pd.Timestamp specifying end of date range
+    freq: pandas frequency str
+
+    Output:
+    _date_range_cached(): tuple of pd.Timestamp objects (immutable so the cached value can be shared safely)
+    '''
+
+    return(tuple(pd.date_range(start, end, freq = freq)))
+
+
+@functools.lru_cache(maxsize = 128)
+def _infer_freq_cached(date_tuple):
+    '''Memoized pd.infer_freq() for label dates shared across panels.
+
+    Input:
+    date_tuple: tuple of pd.Timestamp objects (tuples are hashable, unlike lists and DatetimeIndexes)
+
+    Output:
+    _infer_freq_cached(): str giving the inferred frequency (or None if it cannot be inferred)
+    '''
+
+    return(pd.infer_freq(pd.DatetimeIndex(date_tuple)))
 
 
 def format_month_irregular(date_obj):
@@ -345,25 +436,115 @@ def concat_ps(ps_list, output_name):
     return(None)
 
 
+def find_ghostscript():
+    '''Locates the Ghostscript executable used by concat_ps_parallel().
+
+    Output:
+    find_ghostscript(): str giving the path of gs (or gswin64c/gswin32c on Windows), or None if Ghostscript is not on the PATH
+    '''
+
+    return(shutil.which("gs") or shutil.which("gswin64c") or shutil.which("gswin32c"))
+
+
+def concat_ps_parallel(ps_list, output_name, jobs = None):
+    '''Converts multiple .ps files into one .pdf file, splitting the conversion across several Ghostscript processes.
+    Ghostscript interprets pages serially, so this replaces concat_ps() followed by ps2pdf when there are enough pages to keep several processes busy.
+    Requires Ghostscript (gs, or gswin64c/gswin32c on Windows) to be on the PATH.
+
+    Inputs:
+    ps_list: list of str specifying file name or file path to input .ps files
+    output_name: str specifying file name or file path of combined .pdf file to be created
+    jobs: positive int specifying how many Ghostscript processes to run at once
+          Defaults to None, which uses os.cpu_count(). Never more processes than there are files in ps_list are started.
+
+    Output:
+    concat_ps_parallel(): None, but creates specified output file
+    '''
+
+    assert len(ps_list) > 0, "ps_list must contain at least one file."
+    gs_path = find_ghostscript()
+    assert gs_path is not None, "Ghostscript (gs) was not found on the PATH."
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    assert jobs > 0, "jobs must be a positive int."
+    chunk_list = [chunk for chunk in np.array_split(np.array([os.fspath(fname) for fname in ps_list], dtype = object), min(jobs, len(ps_list))) if len(chunk) > 0]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        part_list = [os.path.join(tmp_dir, f'part_{ind}.pdf') for ind in range(len(chunk_list))]
+        #All chunks are started before any is waited on so the Ghostscript processes run side by side
+        process_list = []
+        try:
+            for part_name, chunk in zip(part_list, chunk_list):
+                process_list.append(subprocess.Popen([gs_path, "-q", "-dSAFER", "-dNOPAUSE", "-dBATCH", "-sDEVICE=pdfwrite", f'-sOutputFile={part_name}', *chunk]))
+            return_code_list = [process.wait() for process in process_list]
+        finally:
+            #If a later start (or a wait) fails, kill and reap whatever is still running before tmp_dir is removed
+            for process in process_list:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+        assert all(return_code == 0 for return_code in return_code_list), "Ghostscript failed to convert one or more .ps files."
+        concat_pdf(part_list, output_name)
+    return(None)
+
+
 def concat_pdf(pdf_list, output_name):
     '''Concatenates multiple .pdf files into one.
 
     Inputs:
     pdf_list: list of str specifying file name or file path to input .pdf files
+              Elements may also be bytes or binary file-like objects holding pdf data (ie pages saved to io.BytesIO with Exhibit.save_exhibit), so pages never need to touch the disk.
     output_name: str specifying file name or file path of combined .pdf file to be created
+                 The file is replaced in one step once the merge has been written in full (a uniquely named temporary .part file in the same directory is used along the way).
+                 A writable binary file-like object (ie io.BytesIO) is also accepted, in which case the merge is written straight to it.
 
     Output:
-    concat_ps(): None, but creates specified output file
+    concat_pdf(): None, but creates specified output file
     '''
 
     pdf_writer = Pdf.PdfMerger()
     for fin in pdf_list:
+        if isinstance(fin, (bytes, bytearray)):
+            fin = io.BytesIO(fin)
         pdf_writer.append(fin)
-    pdf_writer.write(output_name)
-    pdf_writer.close()
+    if not isinstance(output_name, (str, os.PathLike)):
+        pdf_writer.write(output_name)
+        pdf_writer.close()
+        return(None)
+    
+    #Written to a uniquely named file next to output_name and then swapped in, so readers never see a half-written file, a failed write leaves any previous output intact,
+    #and neither an existing user file nor a concurrent writer's temporary file can be clobbered
+    part_fd, part_name = tempfile.mkstemp(dir = os.path.dirname(os.fspath(output_name)) or ".", suffix = ".part")
+    try:
+        with os.fdopen(part_fd, "wb") as part_file:
+            pdf_writer.write(part_file)
+        #mkstemp creates the file readable by its owner only; give the output the permissions a plain open() would have
+        curr_umask = os.umask(0)
+        os.umask(curr_umask)
+        os.chmod(part_name, 0o666 & ~curr_umask)
+        os.replace(part_name, output_name)
+    finally:
+        pdf_writer.close()
+        if os.path.exists(part_name):
+            os.remove(part_name)
     return(None)
 
 
+@functools.lru_cache(maxsize = 32)
+def _load_font(font_path):
+    '''Memoized FontProperties construction so Exhibits built with the same font files share one object per file.
+    Sharing is safe because matplotlib Text objects copy the FontProperties they are given.
+
+    Input:
+    font_path: str specifying path to .otf/.ttf font file (callers convert path-like objects with os.fspath so equal paths share a cache entry)
+
+    Output:
+    _load_font(): matplotlib.font_manager.FontProperties object for font_path
+    '''
+
+    return(fman.FontProperties(fname = font_path))
+
+
 class Exhibit():
     '''Support class for making pages of charts and tables. Each Exhibit instance corresponds to one pdf/ps page.
     In the following, "panel" is used as a generic term for charts and tables.
@@ -391,6 +572,9 @@ class Exhibit():
                         Note that methods' font_style arguments are ignored when use_tex == True, so font styles need to be dictated in-text with LaTeX 
                         control sequences (ie "\\textbf{...}" for bold font). Be mindful that "\" is an escape character normally, so you will typically use them in pairs.
                         Using this argument does lengthen compilation, so users are encouraged to keep this False unless they really need LaTeX.
+        rc_overrides: dict mapping matplotlib rcParams keys to values, applied after the "classic" style the Exhibit is built on
+                      Defaults to None (no overrides). Setting these before creating an Exhibit has no effect, since the style is reloaded here.
+                      For example, {"path.simplify_threshold": 1.0} lets vector output drop line vertices that deviate from a straight path by less than a pixel.
 
     Attributes:
     orientation: "portrait" or "landscape", determined by orientation argument to Exhibit()
@@ -405,10 +589,13 @@ class Exhibit():
 
     Methods (use help function for more information):
     __init__ (docstring printed above)
+    reuse
     add_exhibit_title
     add_exhibit_captions
     add_exhibit_text
     save_exhibit
+    save_exhibit_multi
+    append_to_pdf
     add_panel_ts
     add_panel_nonts
     add_panel_sec_yaxis
@@ -418,6 +605,7 @@ class Exhibit():
     add_panel_captions
     add_panel_footnotes
     add_panel_text
+    add_panel_texts
     plot_panel_ts_line
     plot_panel_ts_scatter
     plot_panel_ts_barstack
@@ -431,30 +619,66 @@ class Exhibit():
     add_panel_keylines
     add_panel_keydots
     add_panel_keyboxes
+    add_panel_key
     add_panel_hline
     add_panel_vline
+    add_panel_lines
     add_panel_shading
+    add_panel_shading_batch
     add_panel_arrow
     format_panel_numaxis
     format_panel_ts_xaxis
     format_panel_cs_cataxis
     '''
     
-    def __init__(self, layout, normal_font, bold_font, italic_font, bold_italic_font, orientation = "portrait", fig_dim = None, margins = (1, 1, 1, 1.4), h_space = .3, w_space = .25, latex_preamble = None, **kwargs):
+    def __init__(self, layout, normal_font, bold_font, italic_font, bold_italic_font, orientation = "portrait", fig_dim = None, margins = (1, 1, 1, 1.4), h_space = .3, w_space = .25, latex_preamble = None, rc_overrides = None, **kwargs):
         
         plt.style.use('classic')
         
 
-        self.font_dict = {"normal": fman.FontProperties(fname = normal_font), 
-                          "bold": fman.FontProperties(fname = bold_font),
-                          "italic": fman.FontProperties(fname = italic_font),
-                          "bold-italic": fman.FontProperties(fname = bold_italic_font)}
+        self.font_dict = {"normal": _load_font(os.fspath(normal_font)), 
+                          "bold": _load_font(os.fspath(bold_font)),
+                          "italic": _load_font(os.fspath(italic_font)),
+                          "bold-italic": _load_font(os.fspath(bold_italic_font))}
+        
+        self._setup_figure(None, layout, orientation, fig_dim, margins, h_space, w_space, latex_preamble, rc_overrides)
+
+
+    @classmethod
+    def reuse(cls, exhibit, layout, orientation = "portrait", fig_dim = None, margins = (1, 1, 1, 1.4), h_space = .3, w_space = .25, latex_preamble = None, rc_overrides = None):
+        '''Builds a new Exhibit on top of an existing Exhibit's figure and fonts, clearing the figure instead of allocating a new one.
+        Useful when many pages are generated one after another in a single process. 
+        Save exhibit (or append it to a pdf) before calling this, as its panels are discarded and it should not be used afterwards.
+        
+        Inputs:
+        exhibit: Exhibit whose figure and fonts are to be reused
+        Remaining inputs match Exhibit() (see help(cb.Exhibit)).
         
+        Output:
+        reuse(): new Exhibit drawing on exhibit's (cleared) figure
+        '''
+
+        plt.style.use('classic')
+        
+        new_exhibit = cls.__new__(cls)
+        new_exhibit.font_dict = exhibit.font_dict
+        new_exhibit._setup_figure(exhibit.fig, layout, orientation, fig_dim, margins, h_space, w_space, latex_preamble, rc_overrides)
+        exhibit.panel_dict = dict()
+        return(new_exhibit)
+
+
+    def _setup_figure(self, fig, layout, orientation, fig_dim, margins, h_space, w_space, latex_preamble, rc_overrides):
+        '''Sets page dimensions, margins, and grid for the exhibit. Shared by __init__ and reuse.
+        fig is either None (a new figure is created) or an existing figure to be cleared and resized.
+        '''
+
         if latex_preamble is not None:
             plt.rcParams.update({"text.usetex": True,
                                  "text.latex.preamble": latex_preamble})
 
         plt.rcParams['figure.facecolor'] = "w"
+        if rc_overrides is not None:
+            plt.rcParams.update(rc_overrides)
 
         if fig_dim is None:
             if orientation == "portrait":
@@ -468,7 +692,12 @@ class Exhibit():
             # Set orientation parameter based on which dimension is larger.
             self.orientation = f'{"portrait" * (max(fig_dim) == fig_dim[1])}{"landscape" * (max(fig_dim) != fig_dim[1])}'
         
-        self.fig = plt.figure(figsize = self.fig_dim)
+        if fig is None:
+            self.fig = plt.figure(figsize = self.fig_dim)
+        else:
+            fig.clear()
+            fig.set_size_inches(self.fig_dim)
+            self.fig = fig
         self.fig.subplots_adjust(left = margins[0]/self.fig_dim[0], bottom = margins[1]/self.fig_dim[1], 
                                  right = (self.fig_dim[0] - margins[2])/self.fig_dim[0], top = (self.fig_dim[1] - margins[3])/self.fig_dim[1], 
                                  hspace = h_space, wspace = w_space)
@@ -476,6 +705,7 @@ class Exhibit():
         self.grid = self.fig.add_gridspec(layout[0], layout[1])
         
         self.panel_dict = dict()
+        return(None)
 
 
     def add_exhibit_title(self, text_str, dist_from_top = .8, font_style = "bold", font_size = 14):
@@ -553,23 +783,76 @@ class Exhibit():
         return(None)
 
 
-    def save_exhibit(self, filepath, dpi = None, bbox = None):
+    def save_exhibit(self, filepath, dpi = None, bbox = None, file_format = None):
         '''Saves exhibit to file. File formats supported include pdf, ps, eps, png, and jpeg.
         Note that .ps files do not properly apply hatching and alpha settings for barcharts and shaded regions.  Use another file format in these instances.
         
         Inputs:
         filepath: str specifying file to save exhibit to
+                  A writable binary file-like object (ie io.BytesIO) is also accepted, in which case the page is written to it and nothing is saved to disk.
         dpi: float specifying resolution in dots per inch
              Defaults to matplotlib.rcParams["savefig.dpi"]
         bbox: str or Bbox object specifying bounds of exhibit to be saved
               Defaults to matplotlib.rcParams["savefig.bbox"]. 
               Most common non-default is "tight".
+        file_format: str specifying file format (ie "pdf")
+                     Defaults to None, in which case the format is taken from filepath's extension, or is "pdf" when filepath is a file-like object.
         
         Output:
         save_exhibit(): None, but generates desired file
         '''
 
-        self.fig.savefig(filepath, orientation = self.orientation, dpi = dpi, bbox_inches = bbox)
+        if not isinstance(filepath, (str, os.PathLike)):
+            self.fig.savefig(filepath, format = file_format or "pdf", orientation = self.orientation, dpi = dpi, bbox_inches = bbox)
+            return(None)
+        
+        if file_format is None:
+            file_format = os.path.splitext(filepath)[1][1:].lower()
+        if file_format in ["ps", "eps"] or file_format not in self.fig.canvas.get_supported_filetypes():
+            #PostScript bodies are already written in a single call, and saving by path keeps the %%Title comment; unknown extensions are left to matplotlib's own handling
+            self.fig.savefig(filepath, orientation = self.orientation, dpi = dpi, bbox_inches = bbox)
+        else:
+            #A 1 MiB buffer lets the many small PDF objects reach the disk in a handful of write() calls rather than one per 8 KiB
+            with open(filepath, "wb", buffering = 1 << 20) as file_obj:
+                self.fig.savefig(file_obj, format = file_format, orientation = self.orientation, dpi = dpi, bbox_inches = bbox)
+        return(None)
+
+
+    def save_exhibit_multi(self, filepath_list, dpi = None, bbox = None):
+        '''Saves exhibit to several files (ie the same page as both .ps and .pdf) with the same settings.
+        Each file format is written by its own matplotlib backend, so the page is still rendered once per file.
+        
+        Inputs:
+        filepath_list: list of str specifying files to save exhibit to
+        dpi: float specifying resolution in dots per inch
+             Defaults to matplotlib.rcParams["savefig.dpi"]
+        bbox: str or Bbox object specifying bounds of exhibit to be saved
+              Defaults to matplotlib.rcParams["savefig.bbox"]. 
+        
+        Output:
+        save_exhibit_multi(): None, but generates desired files
+        '''
+
+        for filepath in filepath_list:
+            self.save_exhibit(filepath, dpi = dpi, bbox = bbox)
+        return(None)
+
+
+    def append_to_pdf(self, pdf_pages, dpi = None, bbox = None):
+        '''Appends exhibit as a new page of an open multi-page pdf, avoiding a temporary file per page and a concat_pdf pass.
+        
+        Inputs:
+        pdf_pages: matplotlib.backends.backend_pdf.PdfPages object to add the page to
+        dpi: float specifying resolution in dots per inch
+             Defaults to matplotlib.rcParams["savefig.dpi"]
+        bbox: str or Bbox object specifying bounds of exhibit to be saved
+              Defaults to matplotlib.rcParams["savefig.bbox"]. 
+        
+        Output:
+        append_to_pdf(): None, but adds a page to pdf_pages
+        '''
+
+        pdf_pages.savefig(self.fig, orientation = self.orientation, dpi = dpi, bbox_inches = bbox)
         return(None)
 
 
@@ -669,7 +952,7 @@ class Exhibit():
         Inputs:
         original_panel_alias: the panel alias for the chart to receive a second y-axis scale
         sec_alias: preferably a str to act as the dictionary key mapping to the second y-axis object in self.panel_dict
-                   That said, any object type that can act as a dictionary key is acceptable.
+                   That said, any object type that can act as a dictionary key is acceptable, e.g. a tuple such as (original_panel_alias, "left").
         
         Output:
         add_panel_sec_yaxis(): None, but adds second y-axis object to self.panel_dict as a value with key sec_alias
@@ -890,6 +1173,70 @@ class Exhibit():
         return(None)
 
 
+    def add_panel_texts(self, panel_alias, x_pos_list, y_pos_list, text_list, scale = "data", font_style = "normal", font_size = 10, color = "black", horizontal_align = "left", vertical_align = "bottom", rotation = 0):
+        '''Prints several text elements sharing the same style to specified panel in a single call.
+        Equivalent to calling add_panel_text() once per element of text_list, but panel lookup, font resolution, and coordinate conversion are only done once.
+        Intended for tables and other panels where many labels share a style.
+        
+        Inputs:
+        panel_alias: the panel alias for the chart to add text to.
+        x_pos_list: iterable (list, np.ndarray, etc) specifying x-position of each text element
+                    Elements should be int or float. If scale = "data", date and date str (with format %Y-%m-%d) are also acceptable.
+                    A single value may be supplied instead, in which case every text element shares that x-position.
+        y_pos_list: iterable of ints or floats specifying y-position of each text element
+                    A single value may be supplied instead, in which case every text element shares that y-position.
+        text_list: iterable of str specifying text of each element
+        scale: Specifies scale to use for interpreting x_pos_list and y_pos_list.
+               Defaults to "data", which uses scale of axes. 
+               All other values (but preferably the str "fixed") will cause it to interpret positions as fixed-axis units (mostly lie in [-1.1, 1.1]).
+        font_size: int specifying fontsize for text.
+                   Defaults to 10.
+        font_style: str for "normal", "bold", "italic", or "bold-italic" font.
+                    Defaults to "normal".
+        color: str specifying color of text.
+               Defaults to "black".
+        horizontal_align: str specifying horizontal alignment of text. Can be "left", "center", or "right".
+                        Defaults to "left".
+        vertical_align: str specifying vertical alignment of text. Can be "bottom", "center", or "top".
+                        Defaults to "bottom".
+        rotation: float or int specifying the rotation (in degrees) to be applied to the text elements
+                  Defaults to 0.
+        
+        Output:
+        add_panel_texts(): None, but prints text to specified panel in-place
+        '''
+
+        curr_ax = self.panel_dict[panel_alias]
+        text_list = list(text_list)
+        if np.ndim(x_pos_list) == 0:
+            x_pos_list = [x_pos_list] * len(text_list)
+        if np.ndim(y_pos_list) == 0:
+            y_pos_list = [y_pos_list] * len(text_list)
+        assert len(x_pos_list) == len(text_list) and len(y_pos_list) == len(text_list), "x_pos_list, y_pos_list, and text_list must have the same number of elements."
+        
+        if scale == "data":
+            x_coords = []
+            for x_pos in x_pos_list:
+                if not isinstance(x_pos, numbers.Number):
+                    if isinstance(x_pos, pd.Period):
+                        x_pos = x_pos.to_timestamp()
+                    x_pos = mdates.date2num(pd.Timestamp(x_pos))
+                x_coords.append(x_pos)
+            y_coords = y_pos_list
+        else:
+            x_lim = curr_ax.get_xlim()
+            y_lim = curr_ax.get_ylim()
+            x_coords = (np.asarray(x_pos_list, dtype = float) * (x_lim[1] - x_lim[0])) + x_lim[0]
+            y_coords = (np.asarray(y_pos_list, dtype = float) * (y_lim[1] - y_lim[0])) + y_lim[0]
+        
+        font_prop = self.font_dict[font_style]
+        for x_coord, y_coord, text_str in zip(x_coords, y_coords, text_list):
+            curr_ax.text(x_coord, y_coord, text_str, 
+                         fontproperties = font_prop, fontsize = font_size, color = color,
+                         ha = horizontal_align, va = vertical_align, rotation = rotation)
+        return(None)
+
+
     def add_panel_keylines(self, panel_alias, x_pos, y_pos, text_list, keyline_length = .08, color_list = None, style_list = None, alpha_list = None, width_list = None, 
                            scale = "data", font_size = 9, text_xoffset = .015, text_yoffset = -.019, y_delta = -.06):
         '''Prints keylines (legend-esque information) to specified panel.
@@ -1108,6 +1455,93 @@ class Exhibit():
         return(None)
 
 
+    def add_panel_key(self, panel_alias, x_pos, y_pos, entry_list, alpha = 1, line_width = 1, scale = "data", font_size = 9,
+                      box_length = .05, box_width = .04, text_xoffset = .065, text_yoffset = -.018, x_delta = 0, y_delta = -.06):
+        '''Prints a key of boxes (legend-esque information) to specified panel, drawing all boxes that share a hatching pattern as one collection.
+        Equivalent to add_panel_keyboxes(), but entries may also be laid out side by side through x_delta, so a key that would otherwise take
+        several add_panel_keyboxes() calls can be drawn with one.
+        Note that .ps files do not properly apply hatching. Use another file format in these instances.
+        
+        Inputs:
+        panel_alias: the panel alias for the chart to add the key to.
+        x_pos: specifies x-position of first keybox
+               int or float. If scale = "data", date and date str (with format %Y-%m-%d) are also acceptable.
+               A list with one x-position per element of entry_list may be supplied instead, in which case x_delta is ignored.
+        y_pos: int or float specifying y-position of first keybox
+               A list with one y-position per element of entry_list may be supplied instead, in which case y_delta is ignored.
+        entry_list: list of (label, face color, edge color, hatching) tuples, one per keybox
+                    Label, face color, and edge color are str. Hatching is a str such as "" for no hatching, "/", "\", "x", and "+".
+        alpha: int or float specifying opaqueness of keyboxes
+               Defaults to 1.
+        line_width: float specifying width of keybox edges
+                    Defaults to 1.
+        scale: Specifies scale to use for interpreting x_pos and y_pos.
+               Defaults to "data", which uses scale of axes. 
+               All other values (but preferably the str "fixed") will cause it to interpret x_pos and y_pos as fixed-axis units (mostly lie in [-1.1, 1.1]).
+        font_size: int specifying fontsize for text.
+                   Defaults to 9.
+        box_length: float specifying horizontal dimension of keyboxes in fixed-axis units
+                    Defaults to .05
+        box_width: float specifying vertical dimension of keyboxes in fixed-axis units
+                   Defaults to .04
+        text_xoffset: float specifying horizontal distance of labels from corresponding keyboxes in fixed-axis units
+                      Defaults to .065
+        text_yoffset: float specifying vertical distance of labels from corresponding keyboxes in fixed-axis units
+                      Defaults to -.018
+        x_delta: float specifying horizontal distance between consecutive keyboxes in fixed-axis units
+                 Defaults to 0
+        y_delta: float specifying vertical distance between consecutive keyboxes in fixed-axis units
+                 Defaults to -.06
+        
+        Output:
+        add_panel_key(): None, but adds key to specified panel in-place
+        '''
+
+        curr_ax = self.panel_dict[panel_alias]
+        x_pos_list = list(x_pos) if isinstance(x_pos, (list, tuple, np.ndarray)) else [x_pos]
+        y_pos_list = list(y_pos) if isinstance(y_pos, (list, tuple, np.ndarray)) else [y_pos]
+        assert len(x_pos_list) in [1, len(entry_list)] and len(y_pos_list) in [1, len(entry_list)], "x_pos and y_pos must be single positions or have one element per entry in entry_list."
+        if scale == "data":
+            x_coord_list = []
+            for x_coord in x_pos_list:
+                if not isinstance(x_coord, numbers.Number):
+                    if isinstance(x_coord, pd.Period):
+                        x_coord = x_coord.to_timestamp()
+                    x_coord = mdates.date2num(pd.Timestamp(x_coord))
+                x_coord_list.append(x_coord)
+            y_coord_list = y_pos_list
+        else:
+            x_coord_list = [fixed2data(x_coord, curr_ax, 0) for x_coord in x_pos_list]
+            y_coord_list = [fixed2data(y_coord, curr_ax, 1) for y_coord in y_pos_list]
+        x_range = curr_ax.get_xlim()[1] - curr_ax.get_xlim()[0]
+        y_range = curr_ax.get_ylim()[1] - curr_ax.get_ylim()[0]
+        
+        if len(x_coord_list) == 1:
+            x_coords = x_coord_list[0] + np.arange(len(entry_list)) * x_delta * x_range
+        else:
+            x_coords = np.asarray(x_coord_list, dtype = float)
+        if len(y_coord_list) == 1:
+            y_coords = y_coord_list[0] + np.arange(len(entry_list)) * y_delta * y_range
+        else:
+            y_coords = np.asarray(y_coord_list, dtype = float)
+        
+        #A collection carries a single hatching pattern, so boxes are grouped by hatch
+        hatch_groups = {}
+        for ind, (label, face_color, edge_color, hatch) in enumerate(entry_list):
+            hatch_groups.setdefault(hatch, []).append(ind)
+        for hatch, ind_list in hatch_groups.items():
+            verts = [[(x_coords[ind], y_coords[ind] - (box_width/2 * y_range)), (x_coords[ind] + box_length * x_range, y_coords[ind] - (box_width/2 * y_range)),
+                      (x_coords[ind] + box_length * x_range, y_coords[ind] + (box_width/2 * y_range)), (x_coords[ind], y_coords[ind] + (box_width/2 * y_range))] for ind in ind_list]
+            curr_ax.add_collection(mcollections.PolyCollection(verts, facecolors = [entry_list[ind][1] for ind in ind_list], edgecolors = [entry_list[ind][2] for ind in ind_list], 
+                                                               hatch = hatch, alpha = alpha, linewidths = line_width))
+        
+        font_prop = self.font_dict["normal"]
+        for ind, entry in enumerate(entry_list):
+            curr_ax.text(x_coords[ind] + (text_xoffset * x_range), y_coords[ind] + (text_yoffset * y_range), entry[0], 
+                         fontproperties = font_prop, fontsize = font_size, color = 'black')
+        return(None)
+
+
     def add_panel_hline(self, panel_alias, y, x_min = None, x_max = None, scale = "data", line_style = "-", line_width = 1.3, color = "black", alpha = 1):
         '''Prints horizontal line to specified panel.
         
@@ -1209,6 +1643,50 @@ class Exhibit():
         curr_ax.axvline(x, y_min, y_max, ls = line_style, lw = line_width, color = color, alpha = alpha)
         return(None)
 
+
+    def add_panel_lines(self, panel_alias, segment_list, scale = "data", line_style = "-", line_width = 1, color = "black", alpha = 1):
+        '''Prints several straight line segments sharing the same style to specified panel as a single LineCollection.
+        Intended for table borders and other panels where add_panel_hline() and add_panel_vline() would otherwise be called once per line.
+        
+        Inputs:
+        panel_alias: the panel alias for the chart to add the lines to
+        segment_list: list of ((x0, y0), (x1, y1)) tuples giving the endpoints of each segment
+                      If scale = "data", x-coordinates may also be dates or date strs (with format %Y-%m-%d).
+        scale: str specifying how the function should interpret the coordinates in segment_list
+               Defaults to "data", in which case these arguments are interpreted according to the axes' scale.
+               Otherwise, the coordinates are interpreted in fixed-axis units (mostly lie in [-1.1, 1.1]).
+        line_style: str specifying style of lines to draw
+                    Common linestyles include "-" for solid, "--" for dashed, and ":" for dotted.
+                    Defaults to "-"
+        line_width: int or float specifying width of lines to draw in points, or a list with one width per segment
+                    Defaults to 1
+        color: str specifying the lines' color
+               Defaults to "black"
+        alpha: int or float specifying opaqueness of lines
+               Defaults to 1.
+        
+        Output:
+        add_panel_lines(): None, but adds the line segments to specified panel in place.
+        '''
+
+        curr_ax = self.panel_dict[panel_alias]
+        verts = []
+        for (x0, y0), (x1, y1) in segment_list:
+            x_pair = [x0, x1]
+            if scale == "data":
+                for ind in range(2):
+                    if not isinstance(x_pair[ind], numbers.Number):
+                        if isinstance(x_pair[ind], pd.Period):
+                            x_pair[ind] = x_pair[ind].to_timestamp()
+                        x_pair[ind] = mdates.date2num(pd.Timestamp(x_pair[ind]))
+                verts.append([(x_pair[0], y0), (x_pair[1], y1)])
+            else:
+                verts.append([(fixed2data(x_pair[0], curr_ax, 0), fixed2data(y0, curr_ax, 1)), (fixed2data(x_pair[1], curr_ax, 0), fixed2data(y1, curr_ax, 1))])
+        #Match the cap style of the Line2D objects drawn by add_panel_hline()/add_panel_vline()
+        curr_ax.add_collection(mcollections.LineCollection(verts, linestyles = line_style, linewidths = line_width, colors = color, alpha = alpha,
+                                                           capstyle = matplotlib.rcParams["lines.solid_capstyle"]), autolim = False)
+        return(None)
+
     def add_panel_shading(self, panel_alias, x_range, y_low = None, y_high = None, face_color = "dodgerblue", edge_color = None, hatch = "", alpha = .3, scale = "data"):
         '''Adds solid or hatched shading over a region of the specified panel
         Note that .ps files do not properly apply hatching and alpha settings for shaded regions. Use another file format in these instances.
@@ -1272,6 +1750,65 @@ class Exhibit():
         return(None)
 
 
+    def add_panel_shading_batch(self, panel_alias, x_start_list, x_end_list, y_low_list, y_high_list, face_color_list = None, edge_color_list = None, hatch = "", alpha = .3, scale = "data"):
+        '''Adds many rectangular shaded regions to the specified panel as a single collection.
+        Equivalent to calling add_panel_shading() once per rectangle, but all rectangles are drawn as one matplotlib PolyCollection, which is much cheaper to build and render (ie color matrices and heatmaps).
+        Note that .ps files do not properly apply hatching and alpha settings for shaded regions. Use another file format in these instances.
+        
+        Inputs:
+        panel_alias: the panel alias for the chart to add shading to.
+        x_start_list: iterable specifying left x-coordinate of each rectangle
+                      Elements should be int or float. If scale = "data", date and date str (with format %Y-%m-%d) are also acceptable.
+        x_end_list: iterable specifying right x-coordinate of each rectangle (same types as x_start_list)
+        y_low_list: iterable of ints or floats specifying lower bound of each rectangle
+                    A single value may be supplied instead, in which case every rectangle shares that lower bound.
+        y_high_list: iterable of ints or floats specifying upper bound of each rectangle
+                     A single value may be supplied instead, in which case every rectangle shares that upper bound.
+        face_color_list: list of str specifying color of each rectangle's interior
+                         Defaults to ["dodgerblue"]*len(x_start_list)
+        edge_color_list: list of str specifying color of each rectangle's edges and hatching (if applicable)
+                         Defaults to face_color_list
+        hatch: str specifying hatching shared by all rectangles. 
+               Common hatching options include "" for no hatching, "/", "\", "x", and "+".
+               Defaults to ""
+        alpha: float lying in [0,1] that specifies transparency of shading (alpha = 1 equates to minimal transparency)
+               Defaults to .3
+        scale: Specifies scale to use for interpreting coordinates.
+               Defaults to "data", which uses scale of axes. 
+               All other values (but preferably the str "fixed") will cause it to interpret coordinates as fixed-axis units (mostly lie in [-1.1, 1.1]).
+        
+        Output:
+        add_panel_shading_batch(): None, but adds shaded regions to specified panel in-place
+        '''
+
+        curr_ax = self.panel_dict[panel_alias]
+        if face_color_list is None:
+            face_color_list = ["dodgerblue"] * len(x_start_list)
+        if edge_color_list is None:
+            edge_color_list = face_color_list
+        
+        x_bounds = []
+        for x_list in [x_start_list, x_end_list]:
+            if scale == "data" and not isinstance(x_list[0], numbers.Number):
+                if isinstance(x_list[0], pd.Period):
+                    x_list = [x.to_timestamp() for x in x_list]
+                x_list = [mdates.date2num(pd.Timestamp(coord)) for coord in x_list]
+            x_bounds.append(np.asarray(x_list, dtype = float))
+        y_bounds = [np.broadcast_to(np.asarray(y_list, dtype = float), x_bounds[0].shape) for y_list in [y_low_list, y_high_list]]
+        
+        if scale != "data":
+            x_lim = curr_ax.get_xlim()
+            y_lim = curr_ax.get_ylim()
+            x_bounds = [(x * (x_lim[1] - x_lim[0])) + x_lim[0] for x in x_bounds]
+            y_bounds = [(y * (y_lim[1] - y_lim[0])) + y_lim[0] for y in y_bounds]
+        
+        # verts has shape (number of rectangles, 4 corners, 2 coordinates)
+        verts = np.stack([np.column_stack([x_bounds[0], y_bounds[0]]), np.column_stack([x_bounds[1], y_bounds[0]]),
+                          np.column_stack([x_bounds[1], y_bounds[1]]), np.column_stack([x_bounds[0], y_bounds[1]])], axis = 1)
+        curr_ax.add_collection(mcollections.PolyCollection(verts, facecolors = face_color_list, edgecolors = edge_color_list, hatch = hatch, alpha = alpha))
+        return(None)
+
+
     def add_panel_arrow(self, panel_alias, x_range, y_range, color = "black", scale = "data", head_length = .5, head_width = .35):
         '''Draws arrow on specified panel.
 
@@ -1311,7 +1848,7 @@ class Exhibit():
         return(None)
 
 
-    def plot_panel_ts_line(self, panel_alias, ser, ser_freq = None, number_stacks = 1, curr_stack = 1, bar_width_coef = 1, pos_adj = 0, line_color = "black", line_style = "-", line_width = 1, marker_type = "", marker_size = 5, alpha = 1):
+    def plot_panel_ts_line(self, panel_alias, ser, ser_freq = None, number_stacks = 1, curr_stack = 1, bar_width_coef = 1, pos_adj = 0, line_color = "black", line_style = "-", line_width = 1, marker_type = "", marker_size = 5, alpha = 1, x_numeric = None):
         '''Plots a time series on the specified panel as a line.
 
         Inputs:
@@ -1337,6 +1874,7 @@ class Exhibit():
         line_style: str specifying style of line to be plotted. 
                     Common choices include "-" for solid, "--" for dashed, and ":" for dotted
                     Defaults to "-" for solid.
+                    "None" with no marker_type draws nothing and only registers ser's dates with the x-axis (no line object is created, and the y-axis is not autoscaled to ser).
         line_width: float specifying width of line to be plotted in points
                     Defaults to 1
         marker_type: str specifying shape of markers to place over actual observations (which are connected with line segments to form the line).
@@ -1346,12 +1884,18 @@ class Exhibit():
                      Defaults to 5.
         alpha: int or float specifying opaqueness of line
                Defaults to 1.
+        x_numeric: iterable of floats holding ser's dates as matplotlib date numbers (ie matplotlib.dates.date2num(ser.index))
+                   Defaults to None. Supplying it lets a series plotted many times skip the date conversion on each call.
 
         Output:
         plot_panel_ts_line(): None, but adds a line plot to specified panel in-place.
         '''
 
         curr_ax = self.panel_dict[panel_alias]
+        if line_style in ["None", "none", " ", ""] and marker_type in ["None", "none", " ", ""]:
+            #Nothing would be drawn, so only register the date converter (what keeps an otherwise empty panel from getting numeric x-axis labels)
+            curr_ax.xaxis.update_units(period_to_ts(ser).index)
+            return(None)
         x_range = curr_ax.get_xlim()
         
         if type(ser_freq) is str:
@@ -1375,11 +1919,17 @@ class Exhibit():
                 assert len(ser) >= 3, "ser has no stored freq and is not long enough for pd.infer_freq(), so you must specify ser_freq as an argument. See docstring for details."
                 ser_freq_obj = pd.infer_freq(ser.index)
         
-        curr_ax.plot(center_ts_obs(impose_ts_xrange(period_to_ts(ser), x_range), str(ser_freq_obj), number_stacks, curr_stack, bar_width_coef, pos_adj), color = line_color, linestyle = line_style, linewidth = line_width, marker = marker_type, markersize = marker_size, alpha = alpha)
+        if x_numeric is None:
+            plot_args = [center_ts_obs(impose_ts_xrange(period_to_ts(ser), x_range), str(ser_freq_obj), number_stacks, curr_stack, bar_width_coef, pos_adj)]
+        else:
+            #Plain floats carry no units, so register the date converter from a single observation (as the date path does implicitly) to keep date tick labels
+            curr_ax.xaxis.update_units(period_to_ts(ser.iloc[:1]).index)
+            plot_args = _center_ts_numeric(ser, x_numeric, x_range, str(ser_freq_obj), number_stacks, curr_stack, bar_width_coef, pos_adj)
+        curr_ax.plot(*plot_args, color = line_color, linestyle = line_style, linewidth = line_width, marker = marker_type, markersize = marker_size, alpha = alpha)
         return(None)
 
 
-    def plot_panel_ts_scatter(self, panel_alias, ser, ser_freq = None, number_stacks = 1, curr_stack = 1, bar_width_coef = 1, pos_adj = 0, scatter_type = "o", scatter_color = "black", scatter_size = 5, alpha = 1):
+    def plot_panel_ts_scatter(self, panel_alias, ser, ser_freq = None, number_stacks = 1, curr_stack = 1, bar_width_coef = 1, pos_adj = 0, scatter_type = "o", scatter_color = "black", scatter_size = 5, alpha = 1, x_numeric = None):
         '''Plots a time series on the specified panel as a scatterplot.
 
         Inputs:
@@ -1409,6 +1959,8 @@ class Exhibit():
                       Defaults to 5.
         alpha: int or float specifying opaqueness of markers
                Defaults to 1.
+        x_numeric: iterable of floats holding ser's dates as matplotlib date numbers (ie matplotlib.dates.date2num(ser.index))
+                   Defaults to None. Supplying it lets a series plotted many times skip the date conversion on each call.
 
         Output:
         plot_panel_ts_scatter(): None, but adds a scatterplot to specified panel in-place.
@@ -1438,12 +1990,18 @@ class Exhibit():
                 assert len(ser) >= 3, "ser has no stored freq and is not long enough for pd.infer_freq(), so you must specify ser_freq as an argument. See docstring for details."
                 ser_freq_obj = pd.infer_freq(ser.index)
         
-        curr_ax.plot(center_ts_obs(impose_ts_xrange(period_to_ts(ser), x_range), str(ser_freq_obj), number_stacks, curr_stack, bar_width_coef, pos_adj), linestyle = "None", marker = scatter_type, color = scatter_color, markersize = scatter_size, alpha = alpha)
+        if x_numeric is None:
+            plot_args = [center_ts_obs(impose_ts_xrange(period_to_ts(ser), x_range), str(ser_freq_obj), number_stacks, curr_stack, bar_width_coef, pos_adj)]
+        else:
+            #Plain floats carry no units, so register the date converter from a single observation (as the date path does implicitly) to keep date tick labels
+            curr_ax.xaxis.update_units(period_to_ts(ser.iloc[:1]).index)
+            plot_args = _center_ts_numeric(ser, x_numeric, x_range, str(ser_freq_obj), number_stacks, curr_stack, bar_width_coef, pos_adj)
+        curr_ax.plot(*plot_args, linestyle = "None", marker = scatter_type, color = scatter_color, markersize = scatter_size, alpha = alpha)
         return(None)
 
 
     def plot_panel_ts_barstack(self, panel_alias, ser_list, ser_freq = None, number_stacks = 1, curr_stack = 1, pos_adj = 0, bar_width_coef = .8, edge_color_list = None, face_color_list = None, 
-                               hatch_list = None, alpha_list = None, line_width_list = None):
+                               hatch_list = None, alpha_list = None, line_width_list = None, window = None, rasterized = False):
         '''Plots time series on the specified panel as a stacked barchart.
         Note that .ps files do not properly apply hatching for barcharts. Use another file format in these instances.
 
@@ -1479,12 +2037,19 @@ class Exhibit():
                     Defaults to [1]*len(ser_list).
         line_width_list: list of float or int specifying width of bar edges in points
                          Defaults to [1]*len(ser_list).
+        window: 2-element tuple or list of date objects or date str (ie ("2017", "2020")) specifying the first and last dates of each series to plot
+                Interpreted the same way as label-based slicing (ser["2017":"2020"]), but each series is subset by integer position instead of label lookups.
+                Defaults to None, in which case the series are plotted in full.
+        rasterized: bool specifying whether the bars should be drawn as an embedded bitmap in vector output (.pdf, .ps, .eps) rather than one vector path per bar
+                    Defaults to False. Only pays off for much denser series (thousands of bars); for a few dozen bars the embedded bitmap is larger than the vector paths and blurrier, since it is rendered at the dpi passed to save_exhibit.
 
         Output:
         plot_panel_ts_barstack(): None, but adds a bar stack to specified panel in-place.
         '''        
 
         curr_ax = self.panel_dict[panel_alias]
+        if window is not None:
+            ser_list = [ser.iloc[slice(*ser.index.slice_locs(window[0], window[1]))] for ser in ser_list]
         if edge_color_list is None:
             edge_color_list = ["black"] * len(ser_list)
         if face_color_list is None:
@@ -1545,7 +2110,7 @@ class Exhibit():
                     bottom_list[2][ind] = bottom_list[1][ind]
                     bottom_list[1][ind] += centered_list[ser_num][centered_list[ser_num].index[ind]]
             curr_ax.bar(all_index, centered_list[ser_num], width = bar_width, linewidth = line_width_list[ser_num], edgecolor = edge_color_list[ser_num], 
-                        facecolor = face_color_list[ser_num], hatch = hatch_list[ser_num], alpha = alpha_list[ser_num], bottom = bottom_list[2])
+                        facecolor = face_color_list[ser_num], hatch = hatch_list[ser_num], alpha = alpha_list[ser_num], bottom = bottom_list[2], rasterized = rasterized)
         return(None)
 
 
@@ -1686,25 +2251,16 @@ class Exhibit():
         bar_width = bar_width_coef/number_stacks
         bar_locations = center_cs_obs(ser_list[0], number_stacks = number_stacks, curr_stack = curr_stack, width_coef = bar_width_coef, pos_adj = pos_adj)
         
-        # bottom_list holds information for where each bar should start vertically (or horizontal when making a horizontal bar chart)
-        # bottom_list[0] ([1]) holds running tally of all positive (negative) values already plotted
-        # bottom_list[2] is updated with vertical starting positions for each bar of each series. It is reset from scratch for each series.
-        bottom_list = [[0] * len(ser_list[0]), [0] * len(ser_list[0]), [0] * len(ser_list[0])]
+        # bottom_array[i] holds where each bar of ser_list[i] should start vertically (or horizontally when making a horizontal bar chart)
+        bottom_array = _stack_bottoms(ser_list)
         
         for ser_num in range(len(ser_list)):
-            for ind in range(len(ser_list[ser_num])):
-                if ser_list[ser_num][ind] >= 0:
-                    bottom_list[2][ind] = bottom_list[0][ind]
-                    bottom_list[0][ind] += ser_list[ser_num][ind]
-                else:
-                    bottom_list[2][ind] = bottom_list[1][ind]
-                    bottom_list[1][ind] += ser_list[ser_num][ind]
             if orientation == "vertical":
                 curr_ax.bar(bar_locations, ser_list[ser_num], width = bar_width, linewidth = line_width_list[ser_num], edgecolor = edge_color_list[ser_num], 
-                            facecolor = face_color_list[ser_num], hatch = hatch_list[ser_num], alpha = alpha_list[ser_num], bottom = bottom_list[2])
+                            facecolor = face_color_list[ser_num], hatch = hatch_list[ser_num], alpha = alpha_list[ser_num], bottom = bottom_array[ser_num])
             else:
                 curr_ax.barh(bar_locations, ser_list[ser_num], height = bar_width, linewidth = line_width_list[ser_num], edgecolor = edge_color_list[ser_num], 
-                             facecolor = face_color_list[ser_num], hatch = hatch_list[ser_num], alpha = alpha_list[ser_num], left = bottom_list[2])
+                             facecolor = face_color_list[ser_num], hatch = hatch_list[ser_num], alpha = alpha_list[ser_num], left = bottom_array[ser_num])
         return(None)
 
 
@@ -1894,7 +2450,7 @@ class Exhibit():
               Defaults to 1 (vertical axis), which is what should be used for vertical bar charts. If making a horizontal bar chart, 0 (horizontal axis) should be used instead.
         num_range: list or tuple of 2 floats or ints specifying lower and upper bound of axis scale
                    Defaults to bounds automatically determined by matplotlib
-        tick_pos: list, tuple, or generator of ints or floats specifying axis values where ticks should be placed.
+        tick_pos: list, tuple, generator, or numpy array of ints or floats specifying axis values where ticks should be placed.
                   Defaults to set of tick positions automatically determined by matplotlib
         skip_ticks: list of coordinates from tick_pos where ticks should not be drawn
                     If an element is in tick_pos and this list, a label will still be placed at that element.
@@ -1956,7 +2512,8 @@ class Exhibit():
             if tick_pos is None:
                 tick_pos = list(curr_ax.get_yticks())
             else:
-                tick_pos = list(tick_pos) #Make sure this is a list object so remove() method is available
+                #Make sure this is a list object so remove() method is available; arrays are unpacked to Python numbers so comparisons below stay scalar
+                tick_pos = tick_pos.tolist() if isinstance(tick_pos, np.ndarray) else list(tick_pos)
             curr_ax.set_ylim(num_range)
             
             if skip_ticks is None:
@@ -1985,22 +2542,25 @@ class Exhibit():
             curr_ax.tick_params(axis = 'y', which = 'major', length = major_length, width = major_width)
             curr_ax.tick_params(axis = 'y', which = 'minor', length = minor_length, width = minor_width)
             curr_ax.yaxis.set_minor_locator(ticker.FixedLocator(actual_tick_pos))
+            #Locators are axis-wide, so they only need to be set once regardless of how many sides are formatted
+            if major_at_end:
+                curr_ax.yaxis.set_major_locator(ticker.FixedLocator(major_pos))
+            else:
+                curr_ax.yaxis.set_major_locator(ticker.NullLocator())
             for side in side_list:
+                side_offset, side_align = side_dict[side]
                 curr_ax.spines[side].set_color(color)
                 for i in range(len(tick_pos)):
                     if ((i % label_skip) == 0) and (tick_pos[i] != major_pos or not major_at_end):
                         if add_minor_labels and not (len(side_list) == 2 and side == "left"):
-                            curr_ax.text(side_dict[side][0], data2fixed(tick_pos[i] + (label_yoffset * (num_range[1] - num_range[0])), curr_ax, 1), 
-                                         label_fmt.format(tick_pos[i]), horizontalalignment = side_dict[side][1], color = color, 
+                            curr_ax.text(side_offset, data2fixed(tick_pos[i] + (label_yoffset * (num_range[1] - num_range[0])), curr_ax, 1), 
+                                         label_fmt.format(tick_pos[i]), horizontalalignment = side_align, color = color, 
                                          fontproperties = self.font_dict['normal'], fontsize = font_size, transform = curr_ax.transAxes)
                 if major_at_end:
-                    curr_ax.yaxis.set_major_locator(ticker.FixedLocator(major_pos))
                     if ((major_pos in tick_pos and (i % label_skip) == 0) or (major_pos not in tick_pos and ((i + 1) % label_skip) == 0)) and add_major_label and not (len(side_list) == 2 and side == "left"):
-                        curr_ax.text(side_dict[side][0], data2fixed(major_pos[0] + (label_yoffset * (num_range[1] - num_range[0])), curr_ax, 1), 
-                                     label_fmt.format(major_pos[0]), horizontalalignment = side_dict[side][1], color = color, 
+                        curr_ax.text(side_offset, data2fixed(major_pos[0] + (label_yoffset * (num_range[1] - num_range[0])), curr_ax, 1), 
+                                     label_fmt.format(major_pos[0]), horizontalalignment = side_align, color = color, 
                                      fontproperties = self.font_dict['normal'], fontsize = font_size, transform = curr_ax.transAxes)
-                else:
-                    curr_ax.yaxis.set_major_locator(ticker.NullLocator())
         else:
             if label_xoffset is None:
                 label_xoffset = 0
@@ -2019,7 +2579,8 @@ class Exhibit():
             if tick_pos is None:
                 tick_pos = list(curr_ax.get_xticks())
             else:
-                tick_pos = list(tick_pos) #Make sure this is a list object so remove() method is available
+                #Make sure this is a list object so remove() method is available; arrays are unpacked to Python numbers so comparisons below stay scalar
+                tick_pos = tick_pos.tolist() if isinstance(tick_pos, np.ndarray) else list(tick_pos)
             curr_ax.set_xlim(num_range)
             
             if skip_ticks is None:
@@ -2048,22 +2609,25 @@ class Exhibit():
             curr_ax.tick_params(axis = 'x', which = 'major', length = major_length, width = major_width)
             curr_ax.tick_params(axis = 'x', which = 'minor', length = minor_length, width = minor_width)
             curr_ax.xaxis.set_minor_locator(ticker.FixedLocator(actual_tick_pos))
+            #Locators are axis-wide, so they only need to be set once regardless of how many sides are formatted
+            if major_at_end:
+                curr_ax.xaxis.set_major_locator(ticker.FixedLocator(major_pos))
+            else:
+                curr_ax.xaxis.set_major_locator(ticker.NullLocator())
             for side in side_list:
+                side_offset, side_align = side_dict[side]
                 curr_ax.spines[side].set_color(color)
                 for i in range(len(tick_pos)):
                     if (i % label_skip == 0) and (tick_pos[i] != major_pos or not major_at_end):
                         if add_minor_labels and not (len(side_list) == 2 and side == "top"):
-                            curr_ax.text(data2fixed(tick_pos[i] + (label_xoffset * (num_range[1] - num_range[0])), curr_ax, 0), side_dict[side][0],
-                                         label_fmt.format(tick_pos[i]), horizontalalignment = "center", verticalalignment = side_dict[side][1], color = color, 
+                            curr_ax.text(data2fixed(tick_pos[i] + (label_xoffset * (num_range[1] - num_range[0])), curr_ax, 0), side_offset,
+                                         label_fmt.format(tick_pos[i]), horizontalalignment = "center", verticalalignment = side_align, color = color, 
                                          fontproperties = self.font_dict['normal'], fontsize = font_size, transform = curr_ax.transAxes)
                 if major_at_end:
-                    curr_ax.xaxis.set_major_locator(ticker.FixedLocator(major_pos))
                     if ((major_pos in tick_pos and (i % label_skip) == 0) or (major_pos not in tick_pos and ((i + 1) % label_skip) == 0)) and add_major_label and not (len(side_list) == 2 and side == "top"):
-                        curr_ax.text(data2fixed(major_pos[0] + (label_xoffset * (num_range[1] - num_range[0])), curr_ax, 0), side_dict[side][0],
-                                     label_fmt.format(major_pos[0]), horizontalalignment = "center", verticalalignment = side_dict[side][1], color = color, 
+                        curr_ax.text(data2fixed(major_pos[0] + (label_xoffset * (num_range[1] - num_range[0])), curr_ax, 0), side_offset,
+                                     label_fmt.format(major_pos[0]), horizontalalignment = "center", verticalalignment = side_align, color = color, 
                                      fontproperties = self.font_dict['normal'], fontsize = font_size, transform = curr_ax.transAxes)
-                else:
-                    curr_ax.xaxis.set_major_locator(ticker.NullLocator())
         return(None)
 
 
@@ -2174,7 +2738,8 @@ class Exhibit():
                             
                         else:
                             assert len(label_dates) >= 3, "label_dates does not have stored freq information and is too short for pd.infer_freq(), so you must specify a freq using label_dates_freqs or infer_freq_from_fmt. See docstring for details."
-                            label_dates_freqs = [pd.infer_freq(label_dates)] * len(label_dates)
+                            inferred_freq = _infer_freq_cached(tuple(pd.Timestamp(x) for x in label_dates))
+                            label_dates_freqs = [inferred_freq] * len(label_dates)
                 else:
                     assert len(label_dates_freqs) in [1, len(label_dates)], "label_dates_freqs must be either one-element long or the same length as label_dates."
                     if len(label_dates_freqs) != len(label_dates):
@@ -2285,8 +2850,8 @@ class Exhibit():
             curr_ax.tick_params(axis = 'x', which = 'major', length = tick_length, width = tick_width, color = color, bottom = True)
             curr_ax.set_xlim(limits)
             curr_ax.xaxis.set_major_locator(ticker.FixedLocator(tick_pos))
-            for ind in range(len(label_list)):
-                curr_ax.text(data2fixed(ind, curr_ax, 0) + label_catoffset, label_numoffset, label_list[ind], 
+            for ind, label in enumerate(label_list):
+                curr_ax.text(data2fixed(ind, curr_ax, 0) + label_catoffset, label_numoffset, label, 
                              color = color, fontproperties = self.font_dict["normal"], 
                              fontsize = font_size, transform = curr_ax.transAxes, ha = horizontal_align, va = vertical_align, rotation = rotation)
         else:
@@ -2298,8 +2863,8 @@ class Exhibit():
             curr_ax.tick_params(axis = 'y', which = 'major', length = tick_length, width = tick_width, color = color, left = True)
             curr_ax.set_ylim(limits)
             curr_ax.yaxis.set_major_locator(ticker.FixedLocator(tick_pos))
-            for ind in range(len(label_list)):
-                curr_ax.text(label_numoffset, data2fixed(ind, curr_ax, 1) + label_catoffset, label_list[ind], 
+            for ind, label in enumerate(label_list):
+                curr_ax.text(label_numoffset, data2fixed(ind, curr_ax, 1) + label_catoffset, label, 
                              color = color, fontproperties = self.font_dict["normal"], 
                              fontsize = font_size, transform = curr_ax.transAxes, ha = horizontal_align, va = vertical_align, rotation = rotation)
         return(None)